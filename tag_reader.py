@@ -1,4 +1,4 @@
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QSettings, QMutex, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QLineEdit,
@@ -8,141 +8,171 @@ from PySide6.QtWidgets import (
     QWidget,
     QMessageBox,
     QHBoxLayout,
-    QCheckBox
+    QCheckBox,
+    QPlainTextEdit
 )
 from PySide6 import QtGui
 import sys
-from pycomm3 import LogixDriver
 import csv
-import pandas as pd
 import re
-import qdarktheme
 import os
 import logging
 from logging.handlers import RotatingFileHandler
 
-handler = RotatingFileHandler('tag_reader.log', maxBytes=100000, backupCount=5)
-logging.basicConfig(handlers=[handler], level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s', datefmt='%m/%d/%Y %I:%M:%S %p')
+# the log file is only opened when TAG_READER_LOG is set, so a normal
+# launch doesn't touch disk or pay formatter costs for filtered records
+_log = logging.getLogger('tag_reader')
 
+if os.environ.get('TAG_READER_LOG'):
+    handler = RotatingFileHandler('tag_reader.log', maxBytes=100000, backupCount=5)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%m/%d/%Y %I:%M:%S %p'))
+    _log.addHandler(handler)
+    _log.setLevel(logging.DEBUG)
+else:
+    _log.addHandler(logging.NullHandler())
+    _log.setLevel(logging.WARNING)
 
-def format_csv(og_file, file, include_raw, is_array):
-    '''
-    Formats the csv file to be more readable by pivoting the data and saving it to a new file.
-
-    Parameters:
-        og_file (str):The original file name.
-        file (str):The name of the raw file to be formatted.
-        include_raw (bool):Whether or not to keep the raw file or delete it.
-        is_array (bool):Whether or not the tag is an array.
-
-    Returns:
-        None
-    '''
-
-    logging.info(f"Formatting CSV: Original File: {og_file}, File: {file}, Include Raw: {include_raw}, Is Array: {is_array}")
+# compiled once at import so splitting the tag input doesn't pay a regex
+# cache lookup on every call
+_TAG_SPLIT_RE = re.compile(r'[\r\n,]+')
 
-    def extract_index(tag):
-        '''
-        Extracts the index from the tag.
+# deletes characters that are illegal in file names in a single C-level
+# pass, without the regex engine
+_ILLEGAL_FN_TABLE = str.maketrans('', '', '<>:"/\\|?*')
 
-        Parameters:
-            tag (str):The tag name to extract the index from.
+# tags per plc.read call; pycomm3 packs each call into as few CIP
+# Multi-Service Packets as the connection size allows, so batching at
+# this level just keeps any single request from growing unbounded
+_READ_BATCH_SIZE = 100
 
-        Returns:
-            int: The index of the tag.
-        '''
-        match = re.search(r'\[(\d+)\]', tag)
-        return int(match.group(1)) if match else None
 
+def _next_file_names(*bases):
+    '''
+    Finds a free csv file name for each given base with a single shared
+    directory scan instead of one os.path.exists probe per existing
+    revision per base.
 
-    def extract_child_names(tag):
-        '''
-        Extracts the child name from the tag.
+    Parameters:
+        bases (str): The file names without the .csv extension.
 
-        Parameters:
-            tag (str):The tag name to extract the child name from.
-        
-        Returns:
-            str: The child name of the tag.
-        '''
+    Returns:
+        tuple: For each base, the base itself if unused, otherwise
+        base_{rev} with the next free revision number.
+    '''
 
-        match = re.search(r'\]\.(.+)', tag)
-        
-        if match:
-            return match.group(1)
-        else:
-            match = re.search(r'^(.*?)(?=\[)', tag)
-            return match.group(1)
+    patterns = [re.compile(re.escape(base) + r'_(\d+)\.csv$') for base in bases]
+    base_names = [f'{base}.csv' for base in bases]
+    base_exists = [False] * len(bases)
+    max_revs = [0] * len(bases)
 
+    with os.scandir('.') as entries:
+        for entry in entries:
+            for i, base_name in enumerate(base_names):
+                if entry.name == base_name:
+                    base_exists[i] = True
+                else:
+                    match = patterns[i].fullmatch(entry.name)
 
-    df = pd.read_csv(f'{file}.csv')
-    df = df.fillna('')
+                    if match:
+                        max_revs[i] = max(max_revs[i], int(match.group(1)))
 
-    if is_array:
-        df['index'] = df['tag'].apply(extract_index)
-        df['child_name'] = df['tag'].apply(extract_child_names)
+    return tuple(base if not exists else f'{base}_{max_rev + 1}'
+                 for base, exists, max_rev in zip(bases, base_exists, max_revs))
 
-        df_pivot = df.pivot_table(index='index', columns='child_name', values='value', aggfunc='first')
 
-        df_pivot.reset_index(inplace=True)
+def format_csv(og_file, header, rows):
+    '''
+    Saves the formatted rows to the csv file. The caller is expected to
+    have already resolved the file name to a free revision.
 
-    else:
-        df_pivot = df.set_index('tag').T
+    Parameters:
+        og_file (str):The file name to write to, without the extension.
+        header (list):The column names.
+        rows (iterable):The data rows to write.
 
-    rev_num = 1
+    Returns:
+        None
+    '''
 
-    if os.path.exists(f'{og_file}.csv'):
-        while os.path.exists(f'{og_file}_{rev_num}.csv'):
-            rev_num += 1
+    _log.info("Formatting CSV: File: %s", og_file)
 
-        og_file = f'{og_file}_{rev_num}'
+    rows = list(rows)
 
-    df_pivot.to_csv(f'{og_file}.csv', index=False)
+    # typical PLC data is all numbers/bools, in which case nothing needs
+    # quoting and the whole table can be formatted and written in one go
+    fast_path = (
+        all(isinstance(value, (int, float)) for row in rows for value in row)
+        and not any(c in name for name in header for c in ',"\r\n')
+    )
 
-    if not include_raw:
-        # remove raw file
-        os.remove(f'{file}.csv')
+    with open(f'{og_file}.csv', 'w', newline='', buffering=1 << 20) as cf:
+        if fast_path:
+            lines = [','.join(map(str, header))]
+            lines.extend(','.join(map(str, row)) for row in rows)
+            cf.write('\r\n'.join(lines) + '\r\n')
+        else:
+            writer = csv.writer(cf)
+            writer.writerow(header)
+            writer.writerows(rows)
 
 
-def flatten_dict(d, parent_key='', sep='.'):
+def iter_flatten(d, parent_key='', sep='.'):
     '''
-    Flattens a dictionary to be able to write it to a csv file.
-    
+    Flattens a dictionary into records to be able to write it to a csv
+    file, one leaf at a time. The walk already knows which array member
+    and which child each leaf belongs to, so it carries them along and
+    consumers don't have to re-parse the flattened key.
+
     Parameters:
         d (dict): The dictionary to flatten.
         parent_key (str): The parent key of the dictionary.
         sep (str): The separator to use between keys.
-    
-    Returns:
-        dict: The flattened dictionary
+
+    Yields:
+        tuple: The flattened key, the index of the outermost array level
+        (None for scalar leaves), the child name under that index, and
+        the value.
     '''
 
-    logging.info(f"Flattening Dictionary: Dictionary: {d}, Parent Key: {parent_key}, Separator: {sep}")
-
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            for i, item in enumerate(v):
-                if isinstance(item, dict):
-                    items.extend(flatten_dict(
-                        item, f"{new_key}[{i}]", sep=sep).items())
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("Flattening Dictionary: Dictionary: %r, Parent Key: %r, Separator: %r", d, parent_key, sep)
+
+    stack = [(parent_key, None, None, d)]
+
+    # iterative depth-first walk; children are pushed in reverse so the
+    # output keeps the same key order the recursive version produced
+    while stack:
+        key, index, child, value = stack.pop()
+
+        if isinstance(value, dict):
+            for k, v in reversed(value.items()):
+                if index is None:
+                    new_child = None
                 else:
-                    items.append((f"{new_key}[{i}]", item))
+                    new_child = f"{child}{sep}{k}" if child else k
+
+                stack.append((f"{key}{sep}{k}" if key else k, index, new_child, v))
+        elif isinstance(value, list):
+            for i in range(len(value) - 1, -1, -1):
+                if index is None:
+                    stack.append((f"{key}[{i}]", i, '', value[i]))
+                else:
+                    stack.append((f"{key}[{i}]", index, f"{child}[{i}]", value[i]))
         else:
-            items.append((new_key, v))
+            if index is not None and not child:
+                # bare array member; label its column with the tag name
+                child = key[:key.find('[')]
 
-    return dict(items)
+            yield key, index, child, value
 
 
 def write_to_csv(data, csv_file, include_raw, is_array):
     '''
-    Writes the data to a csv file.
+    Flattens the data and writes it to a csv file in a single pass,
+    optionally dumping the raw flattened rows alongside.
 
     Parameters:
-        data (dict): The data to write to the csv file.
+        data (dict): The nested tag/value data to write to the csv file.
         csv_file (str): The name of the csv file to write to.
         include_raw (bool): Whether or not to include the raw file.
         is_array (bool): Whether or not the tag is an array.
@@ -151,71 +181,168 @@ def write_to_csv(data, csv_file, include_raw, is_array):
         None
     '''
 
-    logging.info(f"Writing to CSV: Data: {data}, CSV File: {csv_file}, Include Raw: {include_raw}, Is Array: {is_array}")
+    _log.info("Writing to CSV: %d tags, CSV File: %s, Include Raw: %s, Is Array: %s", len(data), csv_file, include_raw, is_array)
 
-    rev_num = 1
-    og_file = csv_file
+    raw_cf = None
+    raw_writer = None
 
-    if os.path.exists(f'{csv_file}_raw.csv'):
-        while os.path.exists(f'{csv_file}_raw_{rev_num}.csv'):
-            rev_num += 1
+    # one directory scan resolves the formatted and raw names together
+    if include_raw:
+        og_file, raw_file = _next_file_names(csv_file, f'{csv_file}_raw')
 
-        csv_file = f'{csv_file}_raw_{rev_num}'
+        raw_cf = open(f'{raw_file}.csv', 'w', newline='', buffering=1 << 20)
+        raw_writer = csv.writer(raw_cf)
+        raw_writer.writerow(('tag', 'value'))
     else:
-        csv_file = f'{csv_file}_raw'
+        og_file, = _next_file_names(csv_file)
+
+    # one pass over the flattened stream feeds both the raw dump and the
+    # pivot, so the full flat dict is never materialized
+    try:
+        if is_array:
+            rows = {}
+            cols = set()
+
+            for tag, index, child_name, value in iter_flatten(data):
+                if raw_writer is not None:
+                    raw_writer.writerow((tag, value))
+
+                if index is None:
+                    continue
+
+                rows.setdefault(index, {})[child_name] = value
+                cols.add(child_name)
+
+            sorted_cols = sorted(cols)
+            header = ['index'] + sorted_cols
+            out_rows = ([index] + [rows[index].get(col, '') for col in sorted_cols]
+                        for index in sorted(rows))
+        else:
+            header = []
+            values = []
+
+            for tag, _, _, value in iter_flatten(data):
+                if raw_writer is not None:
+                    raw_writer.writerow((tag, value))
+
+                header.append(tag)
+                values.append(value)
 
-    with open(f'{csv_file}.csv', 'w', newline='') as cf:
-        writer = csv.DictWriter(cf, fieldnames=['tag', 'value'])
-        writer.writeheader()
-        for tag, value in data.items():
-            writer.writerow({'tag': tag, 'value': value})
+            out_rows = [values]
+    finally:
+        if raw_cf is not None:
+            raw_cf.close()
 
-    format_csv(og_file, csv_file, include_raw, is_array)
+    format_csv(og_file, header, out_rows)
 
 
-def read_tag(tag, ip, file_name_input, include_raw):
+def sanitize_filename(file_name):
     '''
-    Reads the tag from the PLC and writes it to a csv file.
+    Strips illegal characters, surrounding whitespace and any .csv
+    extension from the given file name.
 
     Parameters:
-        tag (str): The tag to read from the PLC.
-        ip (str): The IP address of the PLC.
+        file_name (str): The file name to sanitize.
+
+    Returns:
+        str: The sanitized file name.
+    '''
+
+    file_name = file_name.translate(_ILLEGAL_FN_TABLE).strip()
+
+    return file_name.removesuffix('.csv')
+
+
+def read_tags(plc, tags, file_name_input, include_raw):
+    '''
+    Reads the tags from the PLC in batched requests and writes them to a csv file.
+
+    Parameters:
+        plc (LogixDriver): An open driver connected to the PLC.
+        tags (list): The tags to read from the PLC.
         file_name_input (str): The name of the file to write the data to.
         include_raw (bool): Whether or not to include the raw file.
-    
+
     Returns:
-        None
+        tuple: Whether the read succeeded and a message describing the result.
     '''
-    logging.info(f"Tag Read Requested: Tag: {tag}, IP: {ip}, File Name: {file_name_input}")
+    _log.info("Tag Read Requested: Tags: %s, File Name: %s", tags, file_name_input)
+
+    read_results = []
 
     try:
-        with LogixDriver(ip) as plc:
-            read_result = plc.read(tag)
+        for start in range(0, len(tags), _READ_BATCH_SIZE):
+            batch_results = plc.read(*tags[start:start + _READ_BATCH_SIZE])
+
+            if isinstance(batch_results, list):
+                read_results.extend(batch_results)
+            else:
+                read_results.append(batch_results)
     except Exception as e:
-        logging.error(f"Connection Error: {e}")
-        return
+        _log.error("Connection Error: %s", e)
+        return False, f"Connection Error: {e}"
 
-    # check if the file_name contains illegal characters
-    file_name_input = re.sub(r'[<>:"/\\|?*]', '', file_name_input)
+    file_name_input = sanitize_filename(file_name_input)
 
-    # remove any leading or trailing whitespace
-    file_name_input = file_name_input.strip()
+    data = {}
+    is_array = False
+    errors = []
 
-    # remove file name extension if it exists
-    file_name_input = re.sub(r'\.csv$', '', file_name_input)
-    
-    if not read_result.error:
-        data = {read_result.tag: read_result.value}
-    
-        if type(read_result.value) is list:
-            is_array = True
+    for read_result in read_results:
+        if not read_result.error:
+            data[read_result.tag] = read_result.value
+
+            if isinstance(read_result.value, list):
+                is_array = True
         else:
-            is_array = False
+            _log.error("Tag Read Error: %s: %s", read_result.tag, read_result.error)
+            errors.append(f"{read_result.tag}: {read_result.error}")
 
-        data = flatten_dict(data)
-        write_to_csv(data, file_name_input, include_raw, is_array)
-    else:
-        logging.error(f"Tag Read Error: {read_result.error}")
+    if not data:
+        return False, "No tags could be read:\n" + '\n'.join(errors)
+
+    write_to_csv(data, file_name_input, include_raw, is_array)
+
+    if errors:
+        return True, "Data saved, but some tags could not be read:\n" + '\n'.join(errors)
+
+    return True, "Data saved."
+
+
+class TagReadJob(QRunnable):
+    '''
+    Runs a PLC read off the GUI thread so the window stays responsive
+    while waiting on the network.
+    '''
+
+    class Signals(QObject):
+        finished = Signal(bool, str)
+
+    def __init__(self, get_plc, plc_lock, tags, ip, file_name, include_raw):
+        super(TagReadJob, self).__init__()
+        self.get_plc = get_plc
+        self.plc_lock = plc_lock
+        self.tags = tags
+        self.ip = ip
+        self.file_name = file_name
+        self.include_raw = include_raw
+        self.signals = TagReadJob.Signals()
+
+    def run(self):
+        # hold the lock for the whole read so the window can't close the
+        # shared connection out from under us
+        self.plc_lock.lock()
+
+        try:
+            plc = self.get_plc(self.ip)
+            success, message = read_tags(plc, self.tags, self.file_name, self.include_raw)
+        except Exception as e:
+            _log.error("Connection Error: %s", e)
+            success, message = False, f"Connection Error: {e}"
+        finally:
+            self.plc_lock.unlock()
+
+        self.signals.finished.emit(success, message)
 
 
 class MainWindow(QMainWindow):
@@ -224,10 +351,13 @@ class MainWindow(QMainWindow):
         super(MainWindow, self).__init__()
         self.settings = QSettings("PM Development", "Tag Reader Tool")
 
+        self._plc_cache = {}
+        self._plc_lock = QMutex()
+
         self.setWindowTitle("Tag Reader Tool")
         self.layout = QVBoxLayout()
 
-        self.tag_input = QLineEdit()
+        self.tag_input = QPlainTextEdit()
         self.ip_input = QLineEdit()
         self.raw_file_checkbox = QCheckBox("Output Raw File")
         self.read_tag_button = QPushButton("Read Tag")
@@ -237,11 +367,14 @@ class MainWindow(QMainWindow):
 
         self.file_name_input.setPlaceholderText("Output File Name")
         self.ip_input.setPlaceholderText("Enter PLC IP")
-        self.tag_input.setPlaceholderText("Enter Tag")
+        self.tag_input.setPlaceholderText("Enter Tags (one per line or comma separated)")
 
         # size ip input to be able to handle 40 characters
         self.ip_input.setFixedWidth(250)
 
+        # a few visible lines is enough; the widget scrolls for longer lists
+        self.tag_input.setFixedHeight(80)
+
         self.hor_layout = QHBoxLayout()
 
         self.layout.addWidget(self.ip_input)
@@ -256,10 +389,10 @@ class MainWindow(QMainWindow):
         self.read_history()
         
         self.read_tag_button.clicked.connect(
-            lambda: self.read_tag_clicked(self.tag_input.text(), self.ip_input.text()))
+            lambda: self.read_tag_clicked(self.tag_input.toPlainText(), self.ip_input.text()))
         
         self.about_button.clicked.connect(
-            lambda: QMessageBox.about(self, "About", "This tool was written by Parker Mojsiejenko.\n\nIt uses the following libraries:\n - pycomm3\n - PySide6\n - pandas\n - qdarktheme"))
+            lambda: QMessageBox.about(self, "About", "This tool was written by Parker Mojsiejenko.\n\nIt uses the following libraries:\n - pycomm3\n - PySide6\n - qdarktheme"))
 
         self.help_button.clicked.connect(
             lambda: QMessageBox.about(self, "Help", "This tool requires tag names to be formatted in a specific way to read their data.\n\nIf the tag is an array, it will be in the following format: tag_name[start]{length}\n\nThe [start] can be omitted if you want to start at [0] and if the length is omitted, it will only read the [x] (or [0] if its omitted) member of the array.\n\nIf the tags are program scope tags, the tag name will need to start with Program:program_name.rest_of_tag_name.\n\nFor example, if you want to read a program scope array tag named my_array and start at the 5th member and read 50 members, the tag name would be my_array[4]{50} and if it was a program scope tag in the program my_program it would be Program:my_program.my_array[4]{50}\n\nTwo files will be outputted: one with the raw data and one with the data formatted in a more readable way. If you use a file name that already exists, it will overwrite the existing file. And if the file name is not entered, it will output the file name as tag_data.csv. These files will be saved in the same directory as the tool."))
@@ -272,40 +405,147 @@ class MainWindow(QMainWindow):
         
 
     def read_tag_clicked(self, tag_input, ip_input):
+        tags = [tag.strip() for tag in _TAG_SPLIT_RE.split(tag_input) if tag.strip()]
+
+        if not tags:
+            return
+
         if self.file_name_input.text() == '':
-            file_name = tag_input
+            file_name = tags[0]
         else:
             file_name = self.file_name_input.text()
-        read_tag(tag_input, ip_input, file_name, include_raw=self.raw_file_checkbox.isChecked())
+
+        # disable the button until the read finishes so a second click can't
+        # submit a duplicate job against the same connection
+        self.read_tag_button.setEnabled(False)
+
+        job = TagReadJob(self._get_plc, self._plc_lock, tags, ip_input, file_name,
+                         include_raw=self.raw_file_checkbox.isChecked())
+        job.signals.finished.connect(self.read_finished)
+        QThreadPool.globalInstance().start(job)
+
+
+    def read_finished(self, success, message):
+        self.read_tag_button.setEnabled(True)
+
+        if success:
+            QMessageBox.information(self, "Read Complete", message)
+        else:
+            QMessageBox.warning(self, "Read Failed", message)
+
         self.save_history()
 
 
+    def _get_plc(self, ip):
+        '''
+        Returns an open LogixDriver for the given ip, reusing the cached
+        connection for that ip when one exists. Reconnects if the cached
+        connection has dropped.
+        '''
+        # imported here so launching the window doesn't wait on pycomm3
+        from pycomm3 import LogixDriver
+
+        plc = self._plc_cache.get(ip)
+
+        if plc is None or not plc.connected:
+            plc = LogixDriver(ip)
+            plc.open()
+            self._plc_cache[ip] = plc
+
+        return plc
+
+
+    def _close_plc(self):
+        for plc in self._plc_cache.values():
+            try:
+                plc.close()
+            except Exception as e:
+                _log.error("Error closing PLC connection: %s", e)
+
+        self._plc_cache.clear()
+
+
+    def closeEvent(self, event):
+        self._plc_lock.lock()
+
+        try:
+            self._close_plc()
+        finally:
+            self._plc_lock.unlock()
+
+        self.settings.sync()
+        super(MainWindow, self).closeEvent(event)
+
+
     def read_history(self):
-        self.ip_input.setText(self.settings.value('ip', ''))
-        self.tag_input.setText(self.settings.value('tag', ''))
-        self.file_name_input.setText(self.settings.value('file', ''))
-        checked = self.settings.value('raw', "False")
+        # mirror the stored values in memory so save_history can skip
+        # settings writes for keys that haven't changed
+        self._history = {
+            'ip': self.settings.value('ip', ''),
+            'tag': self.settings.value('tag', ''),
+            'file': self.settings.value('file', ''),
+            'raw': self.settings.value('raw', "False"),
+        }
+
+        self.ip_input.setText(self._history['ip'])
+        self.tag_input.setPlainText(self._history['tag'])
+        self.file_name_input.setText(self._history['file'])
+        self.raw_file_checkbox.setChecked(self._history['raw'] == "True")
+
+
+    def save_history(self):
+        current = {
+            'ip': self.ip_input.text(),
+            'tag': self.tag_input.toPlainText(),
+            'file': self.file_name_input.text(),
+            'raw': self.raw_file_checkbox.isChecked(),
+        }
 
-        if checked == "True":
-            checked = True
+        for key, value in current.items():
+            if self._history.get(key) != value:
+                self.settings.setValue(key, value)
+
+        self._history = current
+
+
+_app_icon = None
+
+
+def _get_app_icon():
+    '''
+    Loads the window icon once and reuses the same QIcon for any later
+    dialogs. Resolved relative to the script so launching from another
+    working directory still finds it.
+    '''
+    global _app_icon
+
+    if _app_icon is None:
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.ico')
+
+        if os.path.exists(icon_path):
+            _app_icon = QtGui.QIcon(icon_path)
         else:
-            checked = False
+            _app_icon = QtGui.QIcon()
 
-        self.raw_file_checkbox.setChecked(checked)
+    return _app_icon
 
 
-    def save_history(self):
-        self.settings.setValue('ip', self.ip_input.text())
-        self.settings.setValue('tag', self.tag_input.text())
-        self.settings.setValue('file', self.file_name_input.text())
-        self.settings.setValue('raw', self.raw_file_checkbox.isChecked())
-
-app = QApplication(sys.argv)
-app.processEvents()
-app.setWindowIcon(QtGui.QIcon('icon.ico'))
-qdarktheme.setup_theme()
-window = MainWindow()
-window.resize(1000, 800)
-window.show()
-
-app.exec()
+def _apply_theme():
+    # deferred so the window paints before the stylesheet import/parse
+    import qdarktheme
+    qdarktheme.setup_theme()
+
+
+def main():
+    app = QApplication(sys.argv)
+    app.setWindowIcon(_get_app_icon())
+    window = MainWindow()
+    window.resize(1000, 800)
+    window.show()
+    QTimer.singleShot(0, _apply_theme)
+
+    app.exec()
+
+
+if __name__ == '__main__':
+    main()